@@ -1,16 +1,25 @@
 #!/usr/bin/python3
 
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
-from datetime import datetime
 from dotenv import load_dotenv
+from functools import cache, partial
 from googleapiclient.discovery import build, Resource
-from typing import Any, Callable, Dict, Generator, List, Union
+from googleapiclient.errors import HttpError
+from googleapiclient.http import build_http
+from types import MappingProxyType
+from typing import Any, Dict, Generator, List, Sequence, Union
 from utilities import Utilities
 import os
-import re
+import shelve
+import threading
+import time
 
-load_dotenv()
+@cache
+def _load_env() -> None:
+	"""Loads the `.env` file into the environment once, on first use."""
+	load_dotenv()
 
 class BaseProcessor(ABC):
 	"""
@@ -22,11 +31,16 @@ class BaseProcessor(ABC):
 
 	Attributes:
 		__slots__ (tuple): A tuple of instance variable names to optimize memory usage.
+		_COLORS (MappingProxyType): Read-only mapping of ARGB fill colors to routine categories.
+		_YT_CLIENTS (dict): YouTube API clients already built in this process, keyed by API key.
 
 	Methods:
 		__init__(args : dict) -> None
 			Initializes the class with configuration arguments and environment variables.
 
+		__init_subclass__(**kwargs) -> None
+			Ensures every subclass declares its own `__slots__`.
+
 		_build_youtube_client() -> googleapiclient.discovery.Resource
 			Initializes and returns a YouTube API client.
 
@@ -39,6 +53,9 @@ class BaseProcessor(ABC):
 		_convert_to_json() -> dict
 			Converts the active worksheet into a JSON-compatible dictionary.
 
+		_fetch_yt_batch(video_ids: Sequence[str], youtube: Resource) -> dict
+			Requests metadata for a batch of YouTube videos in a single API call.
+
 		_extract_time_in_minutes(items: list) -> float
 			Extracts the duration of a YouTube video in minutes from API response items.
 
@@ -57,20 +74,29 @@ class BaseProcessor(ABC):
 		_get_tags() -> list[int]
 			Extracts column numbers of cells containing 'Tag' in the first row.
 
+		_get_video_id(link: str) -> str
+			Extracts the video ID from a YouTube link.
+
 		_get_yt_video_details(video_id: str, part: str) -> dict
 			Fetches content details for a given YouTube video ID using the YouTube Data API.
 
+		_is_fresh(entry: dict | None) -> bool
+			Checks whether a cached YouTube API response is still valid.
+
 		_order_tags() -> None
 			Sorts tag values in worksheet rows in ascending order.
 
-		_process_yt_link(link: str, row: int) -> dict
+		_prefetch_yt_videos(links: list) -> dict
+			Fetches metadata for many YouTube links in batched API requests and caches it.
+
+		_process_yt_link(link: str, row: int, videos: dict | None) -> dict
 			Processes a YouTube link to extract video details and duration.
 
 		_validate_end_range() -> bool
 			Validates that `self._END` is a positive integer greater than `self._START`.
 
-		_wb_handler(func: Callable[..., Any]) -> Callable[..., Any]
-			A decorator that manages a workbook operations for the wrapped function.
+		_yt -> googleapiclient.discovery.Resource
+			Returns the YouTube API client, building it on first use.
 
 		duplicates() -> dict
 			Gets duplicate links from the worksheet with output and error handling.
@@ -90,7 +116,6 @@ class BaseProcessor(ABC):
 	__slots__ = ("_API_KEY",
 				 "_AUTOSEARCH",
 				 "_CHUNK",
-				 "_COLORS",
 				 "_CUSTOM_NAME",
 				 "_END",
 				 "_FILE",
@@ -100,15 +125,30 @@ class BaseProcessor(ABC):
 				 "_START",
 				 "_utilities",
 				 "_youtube_client",
+				 "_yt_http",
+				 "_YT_BATCH_SIZE",
+				 "_YT_CACHE",
+				 "_YT_CACHE_TTL",
+				 "_YT_PARTS",
 				 "_YT_PREFIX",
+				 "_YT_RETRIES",
+				 "_YT_WORKERS",
 				 "_ONLY_FILENAME")
 
+	_COLORS = MappingProxyType({
+		'FFFF0000': 'red',
+		'FF00FF00': 'green',
+		'FFFFFF00': 'yellow'
+	})
+
+	_YT_CLIENTS: Dict[str, Resource] = {}
+
 	def __init__(self, args: dict) -> None:
 		"""
 		Initializes the class with configuration arguments and environment variables.
 
 		Sets up instance variables from a provided args dictionary and environment variables,
-		including API key, YouTube site, workbook details, and color mappings. Also instantiates
+		including API key, YouTube site and workbook details. Also instantiates
 		a Utilities object for additional functionality.
 
 		Args:
@@ -122,16 +162,13 @@ class BaseProcessor(ABC):
 
         Notes:
             - The API key must be set in the environment variable `API_KEY`.
+            - The `.env` file is read on the first instantiation only.
             - The API key can be generated at: https://console.cloud.google.com/apis/credentials.
 		"""
+		_load_env()
 		self._API_KEY = os.getenv('API_KEY')
 		self._AUTOSEARCH = args.get('auto', None)
 		self._CHUNK = args.get('chunk', None)
-		self._COLORS = {
-					'FFFF0000': 'red', 
-					'FF00FF00': 'green', 
-					'FFFFFF00': 'yellow'
-				}
 		self._CUSTOM_NAME = args.get('custom_name', None)
 		self._END = args.get('end', None)
 		if self._END: self._END += 1
@@ -140,10 +177,31 @@ class BaseProcessor(ABC):
 		self._SHEETNAME = args.get('sheet', None)
 		self._START = args.get('start', 2)
 		self._utilities = Utilities()
-		self._youtube_client = self._build_youtube_client()
+		self._youtube_client = None  # Built on first use by `_yt`
+		self._YT_BATCH_SIZE = 50  # Maximum number of IDs accepted by a single `videos().list` request
+		self._YT_CACHE = os.path.join('.cache', 'youtube')
+		self._YT_CACHE_TTL = 24 * 60 * 60  # Seconds a cached API response stays valid
+		self._YT_PARTS = 'contentDetails,snippet'  # Resource parts requested in a single API call
 		self._YT_PREFIX = 'https://youtu.be/'
+		self._YT_RETRIES = 3  # Retries (with exponential backoff) for rate-limited or failed API requests
+		self._YT_WORKERS = 8  # Number of batched API requests sent concurrently
+		self._yt_http = threading.local()  # Per-thread HTTP connection used by `_fetch_yt_batch`
 		self._ONLY_FILENAME = args.get('only_filename', None)
 
+	def __init_subclass__(cls, **kwargs: Any) -> None:
+		"""
+		Ensures every subclass declares its own `__slots__`.
+
+		A subclass without `__slots__` silently gives its instances a `__dict__` again,
+		undoing the memory savings of the slots declared here.
+
+		Raises:
+			TypeError: If the subclass does not define `__slots__` in its class body.
+		"""
+		super().__init_subclass__(**kwargs)
+		if '__slots__' not in cls.__dict__:
+			raise TypeError(f"{cls.__name__} must declare __slots__")
+
 	def _build_youtube_client(self) -> Resource:
 		"""
 		Initializes and returns a YouTube API client.
@@ -154,8 +212,35 @@ class BaseProcessor(ABC):
 		Notes:
 			- Requires an active API key stored in `self._API_KEY`.
 			- Uses the `googleapiclient.discovery` module for API communication.
+			- The discovery document bundled with the library is used, so no network request is made.
+			- Clients are reused across instances sharing the same API key (see `_YT_CLIENTS`).
+		"""
+		client = self._YT_CLIENTS.get(self._API_KEY)
+		if client is None:
+			client = build(
+				'youtube',
+				'v3',
+				developerKey=self._API_KEY,
+				static_discovery=True,
+				cache_discovery=False
+			)
+			self._YT_CLIENTS[self._API_KEY] = client
+		return client
+
+	@property
+	def _yt(self) -> Resource:
 		"""
-		return build('youtube', 'v3', developerKey=self._API_KEY)
+		Returns the YouTube API client, building it on first use.
+
+		Operations that never query YouTube (duplicates, JSON conversion, tags, routines)
+		therefore never build a client.
+
+		Returns:
+			googleapiclient.discovery.Resource: A YouTube API client instance.
+		"""
+		if (client := self._youtube_client) is None:
+			client = self._youtube_client = self._build_youtube_client()
+		return client
 
 	@abstractmethod
 	def _check_for_duplicates(self) -> Dict[str, List[int]]:
@@ -189,13 +274,36 @@ class BaseProcessor(ABC):
 		"""
 		pass
 
+	def _fetch_yt_batch(self, video_ids: Sequence[str], youtube: Resource) -> Dict[str, dict]:
+		"""
+		Requests metadata for a batch of YouTube videos in a single API call.
+
+		Safe to call from worker threads: each thread sends its requests over its own HTTP
+		connection, as the `httplib2` transport behind the API client is not thread-safe.
+
+		Args:
+			video_ids (sequence): Up to `self._YT_BATCH_SIZE` video IDs.
+			youtube (Resource): The API client, resolved by the caller before the workers start.
+
+		Returns:
+			dict: Mapping of video IDs to their API response items. IDs unknown to the API are missing.
+
+		Raises:
+			googleapiclient.errors.HttpError: If the API request fails.
+		"""
+		if (http := getattr(self._yt_http, 'http', None)) is None:
+			http = self._yt_http.http = build_http()
+
+		response = youtube.videos().list(part=self._YT_PARTS, id=','.join(video_ids)).execute(http=http, num_retries=self._YT_RETRIES)
+		return {item['id']: item for item in response.get('items', [])}
+
 	def _extract_time_in_minutes(self, items: list) -> float:
 		"""
 		Extracts the duration of a YouTube video in minutes from API response items.
 		
 		This method follows these operations:
 		- Parses the `duration` field from `contentDetails`.
-		- Extracts hours, minutes, and seconds using regex.
+		- Extracts hours, minutes, and seconds by partitioning the string on 'H', 'M' and 'S'.
 		- Converts the duration to a floating-point number representing minutes.
 		
 		Parameters:
@@ -209,12 +317,17 @@ class BaseProcessor(ABC):
 			- Assumes the first item contains the relevant duration.
 		"""
 		duration = items[0]['contentDetails']['duration']
-		matches = re.findall(r'(\d+)([HMS])', duration)
-		time_dict = {unit: int(value) for value, unit in matches}
-		
-		minutes = time_dict.get('H', 0) * 60 + time_dict.get('M', 0)
-		seconds = time_dict.get('S', 0)
-		minutes += round(seconds / 3) * 5 / 100  # Approximate fractional minutes
+		_, _, clock = duration.partition('T')  # Keep only the time part, e.g. '1H2M3S'
+
+		# Each component is optional, so a missing separator means the value is zero
+		hours, separator, clock = clock.partition('H')
+		if not separator: hours, clock = '0', hours
+		minutes, separator, clock = clock.partition('M')
+		if not separator: minutes, clock = '0', minutes
+		seconds = clock.rstrip('S') or '0'
+
+		minutes = int(hours) * 60 + int(minutes)
+		minutes += round(int(seconds) / 3) * 5 / 100  # Approximate fractional minutes
 		
 		return minutes
 
@@ -269,12 +382,35 @@ class BaseProcessor(ABC):
 		"""
 		pass
 
+	def _get_video_id(self, link: str) -> str:
+		"""
+		Extracts the video ID from a YouTube link.
+
+		Any query string or fragment (e.g., '?t=42', '?si=...', '#t=1m') is dropped, so links
+		to the same video share one API request and one cache entry.
+
+		Args:
+			link (str): The YouTube video URL (e.g., 'https://youtu.be/dQw4w9WgXcQ?t=42').
+
+		Returns:
+			str: The video ID following `self._YT_PREFIX`.
+
+		Raises:
+			ValueError: If `link` has nothing after `self._YT_PREFIX` (or lacks it entirely).
+		"""
+		_, prefix, rest = link.rpartition(self._YT_PREFIX)
+		video_id = rest.partition('?')[0].partition('#')[0]
+		if not prefix or not video_id:
+			raise ValueError(f"Not a YouTube link: '{link}'")
+		return video_id
+
 	def _get_yt_video_details(self, video_id: str, part: str) -> dict:
 		"""
 		Fetches content details for a given YouTube video ID using the YouTube Data API.
 
 		Uses a pre-initialized YouTube API client to request video metadata for the specified `video_id`
-		and `part`, returning the raw API response.
+		and `part`, returning the raw API response. Responses are kept in an on-disk cache (`self._YT_CACHE`)
+		for `self._YT_CACHE_TTL` seconds, so re-runs over the same links do not spend API quota again.
 
 		Args:
 			video_id (str): The unique identifier for the YouTube video (e.g., 'dQw4w9WgXcQ').
@@ -288,9 +424,32 @@ class BaseProcessor(ABC):
 			googleapiclient.errors.HttpError: If the API request fails (e.g., due to invalid `part`, quota limits, or network issues).
 
 		Notes:
-			- Assumes the YouTube API client is initialized once in the class `__init__` method.
+			- The YouTube API client is built by `_yt` on first use and shared by all instances using the same API key.
+			- Rate-limited (HTTP 429) and server-side failures are retried up to `self._YT_RETRIES` times.
+			- Cache entries are keyed on both `part` and `video_id`.
+		"""
+		key = f"{part}:{video_id}"
+		os.makedirs(os.path.dirname(self._YT_CACHE), exist_ok=True)  # Only actions that query YouTube need it
+		with shelve.open(self._YT_CACHE) as cache:
+			if self._is_fresh(entry=cache.get(key)):
+				return cache[key]['response']
+
+			response = self._yt.videos().list(part=part, id=video_id).execute(num_retries=self._YT_RETRIES)
+			cache[key] = {'cached_at': time.time(), 'response': response}
+
+		return response
+
+	def _is_fresh(self, entry: dict | None) -> bool:
+		"""
+		Checks whether a cached YouTube API response is still valid.
+
+		Args:
+			entry (dict | None): A cache entry with 'cached_at' and 'response' keys, or None if missing.
+
+		Returns:
+			bool: True if the entry exists and is younger than `self._YT_CACHE_TTL` seconds.
 		"""
-		return self._youtube_client.videos().list(part=part, id=video_id).execute()
+		return entry is not None and time.time() - entry['cached_at'] < self._YT_CACHE_TTL
 
 	@abstractmethod
 	def _order_tags(self) -> None:
@@ -304,7 +463,72 @@ class BaseProcessor(ABC):
 		"""
 		pass
 
-	def _process_yt_link(self, link: str, row: int) -> dict:
+	def _prefetch_yt_videos(self, links: List[str]) -> Dict[str, dict]:
+		"""
+		Fetches metadata for many YouTube links in batched API requests and caches it.
+
+		Collects the video IDs of the given links that have no fresh cache entry and requests them
+		in groups of up to `self._YT_BATCH_SIZE` IDs per `videos().list` call, requesting all of
+		`self._YT_PARTS` at once. Up to `self._YT_WORKERS` batches are requested concurrently, since
+		the calls spend nearly all of their time waiting on the network. Each video is stored
+		in the cache as if it had been requested on its own, and every response, cached or fetched,
+		is returned so `_process_yt_link` can use it without opening the cache again.
+
+		Args:
+			links (list): YouTube video URLs that are about to be processed.
+
+		Returns:
+			dict: Mapping of video IDs to their API responses (with 'items' empty for unknown videos).
+
+		Raises:
+			googleapiclient.errors.HttpError: If an API request fails.
+
+		Notes:
+			- Videos missing from a response are cached with empty 'items', matching the single-ID response.
+			- Duplicate links are requested only once.
+			- Links without a video ID are skipped, so one bad cell cannot block the batch.
+			- The cache is only written from the calling thread.
+			- Expired entries are dropped whenever the cache is opened here, so it does not keep growing.
+			- The API client is resolved on the calling thread before any worker starts.
+		"""
+		video_ids: List[str] = []
+		for link in links:
+			try:
+				video_ids.append(self._get_video_id(link=link))
+			except ValueError:
+				continue  # Nothing to request; `_process_yt_link` marks the row as non-existent
+		video_ids = list(dict.fromkeys(video_ids))
+
+		os.makedirs(os.path.dirname(self._YT_CACHE), exist_ok=True)  # Only actions that query YouTube need it
+		videos: Dict[str, dict] = {}
+		with shelve.open(self._YT_CACHE) as cache:
+			# Evict expired entries, whatever their part, so the shelf only holds usable responses
+			for key in [key for key in cache.keys() if not self._is_fresh(entry=cache[key])]:
+				del cache[key]
+
+			missing: List[str] = []
+			for video_id in video_ids:
+				if (entry := cache.get(f"{self._YT_PARTS}:{video_id}")) is None:
+					missing.append(video_id)
+				else:
+					videos[video_id] = entry['response']
+
+			batches = [missing[start:start + self._YT_BATCH_SIZE] for start in range(0, len(missing), self._YT_BATCH_SIZE)]
+
+			if batches:
+				# Resolve the client on this thread and hand it to the workers, so they never race to build one
+				fetch_batch = partial(self._fetch_yt_batch, youtube=self._yt)
+
+				with ThreadPoolExecutor(max_workers=self._YT_WORKERS) as executor:
+					for batch, items in zip(batches, executor.map(fetch_batch, batches)):
+						for video_id in batch:
+							response = {'items': [items[video_id]] if video_id in items else []}
+							cache[f"{self._YT_PARTS}:{video_id}"] = {'cached_at': time.time(), 'response': response}
+							videos[video_id] = response
+
+		return videos
+
+	def _process_yt_link(self, link: str, row: int, videos: Dict[str, dict] | None = None) -> dict:
 		"""
 		Processes a YouTube link to extract video details and duration.
 
@@ -314,89 +538,75 @@ class BaseProcessor(ABC):
 		Args:
 			link (str): The YouTube video URL to process.
 			row (int): The row number in the worksheet where the link is located.
+			videos (dict, optional): API responses keyed by video ID, as returned by `_prefetch_yt_videos`
+				(default: None).
 
 		Returns:
 			dict: A dictionary containing video details (e.g., {'duration': float}) on success, 
 				or an error message (e.g., {'error': str}) on failure.
 
 		Raises:
-			ValueError: If the provided `link` is not a valid YouTube URL.
 			RuntimeError: If the YouTube Data API request fails (e.g., due to network issues or API limits).
 
 		Notes:
-			- Relies on `_get_yt_video_details` to fetch video metadata from the YouTube Data API.
+			- Takes the response from `videos` when present; only a miss goes through `_get_yt_video_details`,
+			which opens the on-disk cache and, failing that, calls the YouTube Data API.
 			- Uses `_extract_time_in_minutes` to convert the video duration to a float value in minutes.
+			- A link without a video ID (e.g., a bare `self._YT_PREFIX`) is marked as 'non-existent'
+			without any API request.
 		"""
 		try:
-			video_id = link.split(self._YT_PREFIX)[1]
-			content_details = self._get_yt_video_details(video_id=video_id, part='contentDetails')
-			snippet = self._get_yt_video_details(video_id=video_id, part='snippet')
-		except Exception as e:
-			raise Exception(f"Unexpected error: {e}")
-
-		link_info = {
-						link: {
-							'Duration': None,
-							'Published': None,
-							'Author': None,
-							'Exist': None
-						}
-					}
-
-		if content_details.get('items', []): 
-			link_info[link]['Duration'] = self._extract_time_in_minutes(items=content_details['items'])
+			video_id = self._get_video_id(link=link)
+		except ValueError:
+			details = {}  # No video to look up; the record is marked as non-existent below
+		else:
+			if (details := (videos or {}).get(video_id)) is None:
+				try:
+					details = self._get_yt_video_details(video_id=video_id, part=self._YT_PARTS)
+				except HttpError as e:
+					raise RuntimeError(f"YouTube API request for '{video_id}' failed: {e}") from e
+
+		info = {
+					'Duration': None,
+					'Published': None,
+					'Author': None,
+					'Exist': None
+				}
+		link_info = {link: info}
 
-		if snippet.get('items', []):
+		items = details.get('items', [])
+		if items: 
+			info['Duration'] = self._extract_time_in_minutes(items=items)
 
-			# Check if timestamp is not None before parsing
-			timestamp = snippet['items'][0]['snippet'].get('publishedAt', None)
+			# Rearrange 'YYYY-MM-DDTHH:MM:SSZ' into 'HH:MM:SS DD-MM-YYYY' if the timestamp is present
+			snippet = items[0]['snippet']
+			timestamp = snippet.get('publishedAt', None)
 			published = (
-				datetime.strptime(timestamp, "%Y-%m-%dT%H:%M:%SZ").strftime("%H:%M:%S %d-%m-%Y")
+				f"{timestamp[11:19]} {timestamp[8:10]}-{timestamp[5:7]}-{timestamp[0:4]}"
 				if timestamp else None
 			)
 
-			link_info[link]['Published'] = published
-			link_info[link]['Author'] = snippet['items'][0]['snippet'].get('channelTitle', None)
+			info['Published'] = published
+			info['Author'] = snippet.get('channelTitle', None)
 
-		if not link_info[link]['Duration'] or not link_info[link]['Published'] or not link_info[link]['Author']:
-			link_info[link]['Exist'] = 'non-existent'
+		if not info['Duration'] or not info['Published'] or not info['Author']:
+			info['Exist'] = 'non-existent'
 
 		return link_info
 
-	def _wb_handler(self, func: Callable[..., Any]) -> Callable[..., Any]:
-			"""
-			A decorator that manages a workbook operations for the wrapped function using a context manager.
-
-			Ensures a workbook is loaded and worksheet is selected before executing the wrapped function,
-			then saves the workbook afterward, even if an error occurs.
-
-			Args:
-				func (Callable[..., Any]): The function to decorate, which operates on the workbook.
-
-			Returns:
-				Callable[..., Any]: A wrapper function that encapsulates workbook handling.
-
-			Raises:
-				TypeError: If func is not callable.
-				ValueError: If workbook or sheet cannot be loaded.
-			"""
-			if not callable(func):
-				raise TypeError("The provided func must be a callable.")
-
-			def wrapper(*args: Any, **kwargs: Any) -> Any:
-				with self._workbook_manager():
-					result = func(*args, **kwargs)
-					return result
-			return wrapper
-
 	@abstractmethod
 	@contextmanager
-	def _workbook_manager(self) -> Generator[Any, None, None]:
+	def _workbook_manager(self, read_only: bool = False) -> Generator[Any, None, None]:
 		"""Context manager for handling a workbook.
 
 		This method should be implemented by subclasses to manage the lifecycle of a 
 		workbook, ensuring proper loading and saving. The method yields the workbook object 
-		for use within a `with` block.
+		for use within a `with` block. Being a `contextmanager`, the returned object can also
+		decorate a callable directly, which is how the public properties use it.
+
+		Args:
+			read_only (bool, optional): Whether the wrapped operation only reads the workbook.
+				Subclasses may use it to pick a faster loading mode (default: False).
 
 		Yields:
 			Any: The loaded workbook object, allowing operations to be performed on it.
@@ -422,7 +632,7 @@ class BaseProcessor(ABC):
 		"""
 		return	self._utilities.exception_handler(
 					self._utilities.create_output(
-						self._wb_handler(
+						self._workbook_manager(read_only=True)(
 							self._check_for_duplicates),
 						create_output=self._OUTPUT, 
 						custom_name=self._CUSTOM_NAME),
@@ -446,12 +656,12 @@ class BaseProcessor(ABC):
 
 		Notes:
 			- Relies on `_utilities.create_output` for output management and `_utilities.exception_handler` for error logging.
-			- Applies `_wb_handler` for workbook-specific enhancements.
+			- Runs inside `_workbook_manager`, used directly as a decorator.
 			- Uses instance variables `_OUTPUT` and `_CUSTOM_NAME` for configuration.
 		"""
 		return	self._utilities.exception_handler(
 					self._utilities.create_output(
-						self._wb_handler(
+						self._workbook_manager(read_only=True)(
 							self._convert_to_json),
 						create_output=self._OUTPUT, 
 						custom_name=self._CUSTOM_NAME),
@@ -474,12 +684,12 @@ class BaseProcessor(ABC):
 
 		Notes:
 			- Uses `_utilities.create_output` for output management and `_utilities.exception_handler` for error logging.
-			- Applies `_wb_handler` for workbook-specific enhancements.
+			- Runs inside `_workbook_manager`, used directly as a decorator.
 			- Relies on instance variables `_OUTPUT` and `_CUSTOM_NAME` for configuration.
 		"""
 		return	self._utilities.exception_handler(
 					self._utilities.create_output(
-						self._wb_handler(
+						self._workbook_manager()(
 							self._get_links),
 						create_output=self._OUTPUT, 
 						custom_name=self._CUSTOM_NAME),
@@ -503,7 +713,7 @@ class BaseProcessor(ABC):
 		"""
 		return	self._utilities.exception_handler(
 					self._utilities.create_output(
-						self._wb_handler(
+						self._workbook_manager()(
 							self._order_tags),
 						create_output=self._OUTPUT, 
 						custom_name=self._CUSTOM_NAME),
@@ -514,7 +724,7 @@ class BaseProcessor(ABC):
 		"""
 		Retrieves routines using a decorated workbook handler with output and error management.
 
-		This property wraps the `_get_routines` method with `_wb_handler`, creates a output
+		This property wraps the `_get_routines` method with `_workbook_manager`, creates a output
 		using `_utilities.create_output` with the decorated routines and output parameters, and manages
 		exceptions via `_utilities.exception_handler` with error logging.
 
@@ -530,11 +740,11 @@ class BaseProcessor(ABC):
 			- Relies on `_utilities.create_output` for output management and `_utilities.exception_handler`
 			for error handling.
 			- Uses instance variables for custom name and output ID if provided, falling back to defaults otherwise.
-			- Decorated with `_wb_handler` to enhance workbook-related functionality.
+			- Runs inside a read-only `_workbook_manager`, used directly as a decorator.
 		"""
 		return	self._utilities.exception_handler(
 					self._utilities.create_output(
-						self._wb_handler(
+						self._workbook_manager(read_only=True)(
 							self._get_routines),
 						create_output=self._OUTPUT, 
 						custom_name=self._CUSTOM_NAME),
@@ -1,16 +1,152 @@
 #!/usr/bin/python3
 
 from datetime import datetime
-from rwl_xlsx import XlsxProcessor
-from typing import Any, Dict, Optional
+from functools import cache, lru_cache, partial
+from operator import attrgetter
+from pathlib import PurePath
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Optional
 import argparse
-import magic
+import importlib
 import os
 import shutil
 import subprocess
 import sys
+import zipfile
 from utilities import Utilities
 
+# File extensions recognised without inspecting the file's content
+_EXTENSIONS: Dict[str, str] = {
+	'.xlsx':	'xlsx',
+	'.ods':		'ods',
+	'.xls':		'xls'
+}
+
+# Actions that can be requested
+_PROPERTIES: frozenset[str] = frozenset({"links", "routines", "tags", "json", "duplicates"})
+
+# Actions that only read the workbook, so their result is the JSON output alone
+_READ_ONLY_PROPERTIES: frozenset[str] = frozenset({"routines", "json", "duplicates"})
+
+# Leading bytes of the containers used by the supported formats
+_ZIP_SIGNATURE: bytes = b'PK\x03\x04'  # XLSX and ODS
+_OLE_SIGNATURE: bytes = b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1'  # XLS
+
+@lru_cache(maxsize=128)
+def _sniff_filetype(path: str, mtime_ns: int, size: int) -> Optional[str]:
+	"""
+	Recognises the supported formats from their container signatures.
+
+	Args:
+		path (str): Path to the file.
+		mtime_ns (int): Modification time of the file in nanoseconds, as reported by `os.stat`.
+		size (int): Size of the file in bytes, as reported by `os.stat`.
+
+	Returns:
+		str | None: 'xlsx', 'ods' or 'xls', or None if the signature is not conclusive.
+
+	Notes:
+		- XLSX and ODS are both zip archives: ODS is told apart by its `mimetype` entry,
+		XLSX by its `[Content_Types].xml` entry.
+		- `mtime_ns` and `size` are only part of the cache key, so a modified file is inspected again.
+	"""
+	with open(path, 'rb') as file:
+		head: bytes = file.read(len(_OLE_SIGNATURE))
+
+	if head.startswith(_OLE_SIGNATURE):
+		return 'xls'
+
+	if head.startswith(_ZIP_SIGNATURE):
+		try:
+			with zipfile.ZipFile(path) as archive:
+				names: list[str] = archive.namelist()
+				if 'mimetype' in names and archive.read('mimetype') == b'application/vnd.oasis.opendocument.spreadsheet':
+					return 'ods'
+				if '[Content_Types].xml' in names:
+					return 'xlsx'
+		except zipfile.BadZipFile:
+			pass
+
+	return None
+
+def _validate_links(args: Dict[str, Any]) -> Optional[str]:
+	"""
+	Checks the row-range arguments of the `links` action.
+
+	Args:
+		args (dict): Parsed command-line arguments.
+
+	Returns:
+		str | None: Description of the invalid combination, or None if the arguments are valid.
+	"""
+	start: Optional[int] = args.get("start", None)
+	valid_links_combinations = [
+		(start is not None and args.get("end", None) is not None),
+		(start is not None and args.get("chunk", 0) > 0),
+		(args.get("auto", False) and args.get("chunk", 0) > 0),
+		(args.get("auto", False)),
+	]
+
+	if not any(valid_links_combinations):
+		return ("Invalid combination for --links. Allowed combinations are: "
+				"--start with --end, --start with --chunk, --auto with --chunk, or --auto alone.")
+
+def _validate_no_range(args: Dict[str, Any], action: str) -> Optional[str]:
+	"""
+	Ensures a whole-sheet action is not given `--start`, `--end`, `--chunk`, or `--auto`.
+
+	Args:
+		args (dict): Parsed command-line arguments.
+		action (str): Name of the action, used in the message.
+
+	Returns:
+		str | None: Description of the invalid combination, or None if the arguments are valid.
+	"""
+	range_flags = (args.get("start", None), args.get("end", None), args.get("chunk", 0), args.get("auto", False))
+	if any(range_flags):
+		return f"Invalid combination for --{action}. Cannot use with --start, --end, --chunk, or --auto."
+
+def _validate_duplicates(args: Dict[str, Any]) -> Optional[str]:
+	"""
+	Ensures the `duplicates` action writes its result and is not given a row range.
+
+	Args:
+		args (dict): Parsed command-line arguments.
+
+	Returns:
+		str | None: Description of the invalid combination, or None if the arguments are valid.
+	"""
+	if not args.get("output", False):
+		return "--duplicates requires --output"
+	return _validate_no_range(args, "duplicates")
+
+def _validate_routines(args: Dict[str, Any]) -> Optional[str]:
+	"""
+	Ensures the `routines` action is given `--start` and nothing else of the row range.
+
+	Args:
+		args (dict): Parsed command-line arguments.
+
+	Returns:
+		str | None: Description of the invalid combination, or None if the arguments are valid.
+	"""
+	if args.get("start", None) is None:
+		return "--routines requires --start to be specified"
+	if args.get("end", None) is not None or args.get("chunk", 0) > 0 or args.get("auto", False):
+		return "Invalid combination for --routines. It cannot be used with --end, --chunk, or --auto."
+
+# Argument validators of each action
+_VALIDATORS: MappingProxyType = MappingProxyType({
+	'duplicates':	_validate_duplicates,
+	'json':			partial(_validate_no_range, action="json"),
+	'links':		_validate_links,
+	'routines':		_validate_routines,
+	'tags':			partial(_validate_no_range, action="tags")
+})
+
+class RwlInputError(ValueError):
+	"""Raised when the input file or the command-line arguments are invalid."""
+
 class ReadWatchLog:
 	"""
 	Processes spreadsheet files and extracts information using the appropriate processor.
@@ -19,23 +155,37 @@ class ReadWatchLog:
 	and delegates processing tasks such as link extraction, JSON conversion, or tag sorting.
 
 	Attributes:
-		__filetypes (dict): Mapping of MIME types to file extensions (e.g., 'xlsx', 'ods').
-		__processors (dict): Mapping of file extensions to processor classes (e.g., XlsxProcessor).
+		_PROCESSORS (MappingProxyType): Mapping of file extensions to processor classes, as 'module:class'
+			paths imported on first use (e.g., 'rwl_xlsx:XlsxProcessor').
 		_args (dict): Input arguments including file path, sheet name, and processing options.
+		__source_file (str): Path to the input file as given; never modified.
+		__work_file (str): Path to the XLSX file handed to the processor (the converted file for ODS/XLS).
 		__processor (BaseProcessor): Instance of the selected processor class.
+		_ACTIONS (MappingProxyType): Mapping of action names to getters of the matching processor operation.
 	"""
 	__slots__ = ("_args",
 				 "__conversion",
 				 "__called_arg",
 				 "__processor",
-				 "__processors",
 				 "__filetype",
-				 "__filetypes",
 				 "__utilities",
-				 "__temp_file",
 				 "__error_msg",
-				 "__file",
-				 "__preparation")
+				 "__preparation",
+				 "__source_file",
+				 "__stat",
+				 "__work_file")
+
+	_ACTIONS: MappingProxyType = MappingProxyType({
+		'duplicates':	attrgetter('duplicates'),
+		'json':			attrgetter('json'),
+		'links':		attrgetter('links'),
+		'routines':		attrgetter('routines'),
+		'tags':			attrgetter('tags')
+	})
+
+	_PROCESSORS: MappingProxyType = MappingProxyType({
+		'xlsx': 'rwl_xlsx:XlsxProcessor'
+	})
 
 	def __init__(self, args: dict):
 		"""
@@ -58,21 +208,18 @@ class ReadWatchLog:
 		"""
 		self.__filetype = None
 		self.__error_msg = "An error occured. For details see the error-log."
-		self.__filetypes: Dict[str, str] = {
-			'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet': 'xlsx',
-			'application/vnd.oasis.opendocument.spreadsheet': 'ods',
-			'application/vnd.ms-excel': 'xls'
-		}
 		self._args: Dict[str, Any] = args
+		self.__source_file: str = args['file']
+		self.__work_file: Optional[str] = None
 		self.__called_arg: Optional[str] = None
 		self.__utilities = Utilities()
 
 	def __remove_temp(self):
 		shutil.rmtree(self._args['temp_dir'])
-		if not(self._args['main_extension'] in self._args['file']): 
+		if self.__filetype != self._args['main_extension']:  # The XLSX output was only an intermediate file
 			os.remove(self._args['output_file'])
 
-	def __convert(self, convert_args : dict) -> None:
+	def __convert(self, convert_args : dict) -> str:
 		"""
 		Converts a given file to XLSX format using LibreOffice.
 
@@ -80,6 +227,9 @@ class ReadWatchLog:
 		in headless mode. If the conversion is successful, logs the output. If the conversion 
 		fails, logs the error and exits the program with an error message.
 
+		Returns:
+			str: Path to the converted file inside `convert_args['output_dir']`.
+
 		Raises:
 			SystemExit: If the conversion process fails.
 		"""
@@ -94,85 +244,69 @@ class ReadWatchLog:
 			convert_args['output_dir']
 		]
 
-		name, extension = os.path.splitext(convert_args['file'])
-		new_file = ''.join([name, '.', convert_args['to_extension']])
+		name, extension = os.path.splitext(os.path.basename(convert_args['file']))
+		new_file = os.path.join(convert_args['output_dir'], f"{name}.{convert_args['to_extension']}")
 		try:
-			result = subprocess.run(command, check=True, capture_output=True, text=True)
+			# LibreOffice's progress output is never used, so only stderr is kept (for failures)
+			subprocess.run(command, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
 			self.__utilities.logger.info(f"Successful conversion of {convert_args['file']} into {new_file}")
 		except subprocess.CalledProcessError as e:
-			self.__utilities.logger.error(f"Conversion failed: {e.stderr}")
+			self.__utilities.logger.error(f"Conversion failed: {e.stderr.decode(errors='replace')}")
 			sys.exit(self.__error_msg)
 
 		if not os.path.exists(new_file):
 			self.__utilities.logger.error(f"New file {new_file} does not exist")
 			sys.exit(self.__error_msg)
 
-		self._args['file'] = new_file
-
-	def __check_filetype(self) -> None:
-		"""
-		Check the filetype based on the file's MIME type.
-
-		Determines the file type using MIME detection and initializes the corresponding processor.
-
-		Raises:
-			KeyError: If the file format is not recognized or unsupported.
-		"""
-		mime: magic.Magic = magic.Magic(mime=True)
-		fileformat: str = mime.from_file(self._args['file'])
-		self.__filetype: Optional[str] = self.__filetypes.get(fileformat, None)
-		if self.__filetype is None:
-			self.__utilities.logger.error(f"No such format: {fileformat} (file: {self._args['file']})")
-			sys.exit(self.__error_msg)
+		return new_file
 
-	@property
-	def links(self)-> Optional[Dict[str, Any]]:
+	def __input_error(self, message: str) -> RwlInputError:
 		"""
-		Retrieves links from the worksheet with output and error handling.
+		Logs an input-validation failure and builds the exception to raise for it.
 
-		Delegates the call to the `links` method of the selected processor instance.
+		Args:
+			message (str): Description of the invalid input.
 
 		Returns:
-			dict | None: Dictionary of processed links and their attributes, or None if an error occurs.
+			RwlInputError: The exception carrying `message`, for the caller to raise.
 		"""
-		return self.__processor.links()
+		self.__utilities.logger.error(message)
+		return RwlInputError(message)
 
-	@property
-	def json(self)-> Dict[str, Any]:
+	def __get_processor_class(self) -> type:
 		"""
-		Converts worksheet data to a JSON-compatible dictionary with output and error handling.
+		Imports and returns the processor class for the working file format.
 
-		Delegates the call to the `json` method of the selected processor instance.
+		Processor modules are only imported here, so a run pays the import cost of
+		the one processor it actually uses.
 
 		Returns:
-			dict: A dictionary of worksheet data, or an empty dict if an error occurs.
+			type: The processor class registered in `_PROCESSORS` for `main_extension`.
 		"""
-		return self.__processor.json()
+		module_name, class_name = self._PROCESSORS[self._args['main_extension']].split(':')
+		return getattr(importlib.import_module(module_name), class_name)
 
-	@property
-	def tags(self) -> None:
+	def __check_filetype(self) -> None:
 		"""
-		Processes and sorts tags in the worksheet with output and error handling.
+		Check the filetype based on the file's extension, or its content.
 
-		Delegates the call to the `tags` method of the selected processor instance.
+		Determines the file type from the file extension and only inspects the container
+		signature of the file when the extension is unknown.
 
-		Returns:
-			None: Operation completes with no return value or on error.
-		"""
-		return self.__processor.tags()
-
-	@property
-	def duplicates(self)-> Dict[str, Any]:
+		Raises:
+			RwlInputError: If the file format is not recognized or unsupported.
 		"""
-		Gets duplicate links from the worksheet with output and error handling.
+		extension: str = os.path.splitext(self.__source_file)[1].lower()
+		self.__filetype: Optional[str] = _EXTENSIONS.get(extension, None)
+		if self.__filetype is not None:
+			return
 
-		Delegates the call to the `links` method of the selected processor instance.
-
-		Returns:
-			dict: Mapping of duplicate links to their indices, e.g., 
-					{'link1': [0, 3], 'link2': [1, 5]}. Empty dict if no duplicates found.
-		"""
-		return self.__processor.duplicates()
+		self.__filetype = _sniff_filetype(self.__source_file, self.__stat.st_mtime_ns, self.__stat.st_size)
+		if self.__filetype is None:
+			raise self.__input_error(
+				f"No such format (file: {self.__source_file}). "
+				f"Supported formats: {', '.join(_EXTENSIONS.values())}"
+			)
 
 	def __processing(self, stage : str):
 
@@ -182,21 +316,30 @@ class ReadWatchLog:
 				self.__check_args()
 				self.__check_filetype()
 
-				convert_args = {
-					'file':			self._args['file'],
-					'to_extension':	self._args['main_extension'],
-					'output_dir':	self._args['temp_dir']
-				}
-				self.__convert(convert_args=convert_args)
+				# XLSX is read directly, so LibreOffice is only started for other formats;
+				# the processor only reads the file and saves its result under `outputs`
+				if self.__filetype == self._args['main_extension']:
+					self.__work_file = self.__source_file
+				else:
+					convert_args = {
+						'file':			self.__source_file,
+						'to_extension':	self._args['main_extension'],
+						'output_dir':	self._args['temp_dir']
+					}
+					self.__work_file = self.__convert(convert_args=convert_args)
 
 			case "postprocessing":
 
-				convert_args = {
-					'file':			self._args['output_file'],
-					'to_extension':	args['original_extension'],
-					'output_dir':	self._args['outputs_dir']
-				}
-				self.__convert(convert_args=convert_args)
+				# A read-only action leaves the workbook untouched, so converting it back
+				# would only reproduce the input file
+				if (self.__filetype != self._args['main_extension']
+						and self.__called_arg not in _READ_ONLY_PROPERTIES):
+					convert_args = {
+						'file':			self._args['output_file'],
+						'to_extension':	self._args['original_extension'],
+						'output_dir':	self._args['outputs_dir']
+					}
+					self.__convert(convert_args=convert_args)
 				self.__remove_temp()
 
 	def run(self) -> None:
@@ -212,14 +355,16 @@ class ReadWatchLog:
 				(e.g., 'links', 'json'), which processes the file.
 		-	Postprocessing Stage: 
 				Converts the processed file back to its original format 
+				(skipped for the read-only actions 'json', 'duplicates' and 'routines')
 				and performs cleanup by removing temporary files.
 
-		The action to be executed is determined by `self.__called_arg`, which is dynamically
-		retrieved using `getattr(self, self.__called_arg, None)`.
+		The action to be executed is determined by `self.__called_arg`, which is looked up
+		in the `_ACTIONS` table and invoked on the processor directly.
 		"""
 		self.__processing('preprocessing')
-		self.__processor = XlsxProcessor(args=self._args)
-		getattr(self, self.__called_arg, None)
+		self.__processor = self.__get_processor_class()(args={**self._args, 'file': self.__work_file})
+		action: Callable[[], Any] = self._ACTIONS[self.__called_arg](self.__processor)
+		action()
 		self.__processing('postprocessing')
 
 	def __check_args(self) -> None:
@@ -230,83 +375,80 @@ class ReadWatchLog:
 		- Ensures the specified file exists.
 		- Determines the action (`links`, `routines`, `tags`, `json`, `duplicates`) based on provided arguments.
 		- Validates argument dependencies and constraints for each action.
-		- Raises an error and exits if arguments are missing or invalid.
+		- Raises an error if arguments are missing or invalid.
 
 		Raises:
-			SystemExit: If arguments are invalid or no action is specified.
+			RwlInputError: If the file is missing, arguments are invalid, or no action or more than one is specified.
 		"""
-		properties:	set[str]		= {"links", "routines", "tags", "json", "duplicates"}
 		end:		Optional[int]	= self._args.get("end", None)
-		chunk:		int				= self._args.get("chunk", 0)
 		start:		Optional[int]	= self._args.get("start", None)
-		auto:		bool			= self._args.get("auto", False)
-		output:		bool			= self._args.get("output", False)
 
-		if not os.path.exists(self._args['file']):
-			self.__utilities.logger.error(f"File {self._args['file']} does not exist")
-			sys.exit(self.__error_msg)
+		# Stat the file once; the result is reused as the filetype-detection cache key
+		try:
+			self.__stat = os.stat(self.__source_file)
+		except FileNotFoundError:
+			raise self.__input_error(f"File {self.__source_file} does not exist") from None
+
+		# Find the called argument; argparse's mutually exclusive group already allows at most one,
+		# but `ReadWatchLog` can also be built from a plain dict, so the invariant is checked here
+		called_args: List[str] = sorted(key for key in _PROPERTIES if self._args.get(key) is True)
+
+		if len(called_args) > 1:
+			raise self.__input_error(f"Only one action can be specified, got: {', '.join(called_args)}")
+
+		self.__called_arg = next(iter(called_args), None)
 
-		# Find the called argument
-		self.__called_arg = next((key for key in self._args if key in properties and self._args[key] is True), None)
 		if self.__called_arg is None: 
-			self.__utilities.logger.error(f"No action specified. Use one of the following properties: {properties}")
-			sys.exit(self.__error_msg)
+			raise self.__input_error(f"No action specified. Use one of the following properties: {', '.join(sorted(_PROPERTIES))}")
 
-		if end:
+		if end is not None:
 			# Validate range once
-			try:
-				result = isinstance(end, int) and end > start
-			except Exception:
-				self.__utilities.logger.error("Invalid inputs: --end and--start must be integers")
-				sys.exit(self.__error_msg)
-
-			if not result:
-				self.__utilities.logger.error("Invalid range: --end must be greater than --start")
-				sys.exit(self.__error_msg)
-
-		# Define disallowed flags for certain actions
-		range_flags: tuple[Optional[int], Optional[int], int, bool] = (start, end, chunk, auto)
-		no_range_actions: set[str] = {"duplicates", "tags", "json"}
-
-		match self.__called_arg:
-
-			case "links":
-				valid_links_combinations = [
-					(start is not None and end is not None),
-					(start is not None and chunk > 0),
-					(auto and chunk > 0),
-					(auto),
-				]
-
-				if not any(valid_links_combinations):
-					self.__utilities.logger.error("Invalid combination for --links. Allowed combinations are: "
-									"--start with --end, --start with --chunk, --auto with --chunk, or --auto alone.")
-					sys.exit(self.__error_msg)
-
-			# Ensure `--duplicates` does not allow `--start`, `--end`, `--chunk`, or `--auto`
-			case "duplicates":
-				if not output:
-					self.__utilities.logger.error("--duplicates requires --output")
-					sys.exit(self.__error_msg)
-
-				if any(range_flags):
-					self.__utilities.logger.error("Invalid combination for --duplicates. Cannot use with --start, --end, --chunk, or --auto.")
-					sys.exit(self.__error_msg)
-
-			# Ensure `--routines` requires `--start`
-			case "routines":
-				if start is None:
-					self.__utilities.logger.error("--routines requires --start to be specified")
-					sys.exit(self.__error_msg)
-				if end is not None or chunk > 0 or auto:
-					self.__utilities.logger.error("Invalid combination for --routines. It cannot be used with --end, --chunk, or --auto.")
-					sys.exit(self.__error_msg)
-
-			case "tags" | "json":
-				if any(range_flags):
-					self.__utilities.logger.error(f"Invalid combination for --{self.__called_arg}. Cannot use with --start, --end, --chunk, or --auto.")
-					sys.exit(self.__error_msg)
-				
+			if not (isinstance(start, int) and isinstance(end, int)):
+				raise self.__input_error("Invalid inputs: --end and --start must be integers")
+
+			if end <= start:
+				raise self.__input_error("Invalid range: --end must be greater than --start")
+
+		# Validate the arguments specific to the called action
+		if (message := _VALIDATORS[self.__called_arg](self._args)) is not None:
+			raise self.__input_error(message)
+
+@cache
+def _build_parser() -> argparse.ArgumentParser:
+	"""
+	Builds the command-line parser once and returns the same instance on later calls.
+
+	Returns:
+		argparse.ArgumentParser: The parser for the Read-Watch-Log command-line interface.
+
+	Notes:
+		- `--custom_name` has no default here: a timestamp computed at build time would go stale
+		on a cached parser, so `main` fills it in per run instead.
+	"""
+	parser = argparse.ArgumentParser(description="Read-Watch-Log")
+
+	# Define the arguments
+	parser.add_argument('--start', type=int, default=None, help='Start value')
+	parser.add_argument('--end', type=int, default=None, help='End value')
+	parser.add_argument('--output', action='store_true', help='Output flag. If true, output is created. Optional argument.')
+	parser.add_argument('--file', type=str, required=True, default="Vault.xlsx", help='File name to process (XSLX/ODS formats). Required argument.')
+	parser.add_argument('--custom_name', type=str, default=None, help='Custom name of output file (without filetype)')
+	parser.add_argument('--chunk', type=int, default=0, help='Chunk size. Algorithm processes only given number of records. Used with argument `links`.')
+	parser.add_argument('--auto', action='store_true', help='Autosearch of a non-processed record. Used with argument `links`.')
+	parser.add_argument('--sheet', type=str, required=True, default="Vault", help='Sheetname of the given document. Required argument.')
+
+	# Create a mutually exclusive group
+	group = parser.add_mutually_exclusive_group()
+
+	# Add mutually exclusive arguments
+	group.add_argument('--links', action='store_true', help='Get links')
+	group.add_argument('--routines', action='store_true', help='Get routines')
+	group.add_argument('--tags', action='store_true', help='Order tags')
+	group.add_argument('--json', action='store_true', help='Convert to JSON')
+	group.add_argument('--duplicates', action='store_true', help='Detect duplicates')
+
+	return parser
+
 def main(args: argparse.Namespace) -> None:
 	"""
 	Processes command-line arguments and executes the specified action.
@@ -328,64 +470,41 @@ def main(args: argparse.Namespace) -> None:
 	"""
 	# Parse the arguments
 	args = vars(args)
+	if not args.get('custom_name'):
+		args['custom_name'] = datetime.now().strftime("output_%d%m%Y%H%M%S%f")
 
 	# Check existence of directories
 	directories = {key: key for key in ['inputs', 'outputs', 'temp']}
-	[os.makedirs(d, exist_ok=True) for d in directories.values()]
+	for d in directories.values():
+		os.makedirs(d, exist_ok=True)
 
 	# Updating the 'args'
-	only_filename, original_extension = os.path.splitext(args['file'])
-	filename = args['file']
+	path = PurePath(args['file'])
 	main_extension = 'xlsx'
-	output_file = os.path.join(directories['outputs'],
-		f"{args['custom_name']}.{main_extension}" if args.get('output') else f"{only_filename}.{main_extension}"
-	)
+	output_name = args['custom_name'] if args.get('output') else path.stem
 	args.update({
-		'file':				  os.path.join(directories['inputs'], filename),
-		'filename':			  filename,
+		'file':				  str(directories['inputs'] / path),
+		'filename':			  args['file'],
 		'inputs_dir':		  directories['inputs'],
 		'main_extension':	  main_extension,
-		'only_filename':	  only_filename,
-		'original_extension': original_extension[1:],
-		'output_file':		  output_file,
+		'only_filename':	  path.stem,
+		'original_extension': path.suffix[1:],
+		'output_file':		  str(directories['outputs'] / PurePath(f"{output_name}.{main_extension}")),
 		'outputs_dir':		  directories['outputs'],
-		'temp_dir':			  directories['temp'],
-		'temp_file':		  os.path.join(directories['temp'], filename)
+		'temp_dir':			  directories['temp']
 	})
 
-	shutil.copy2(args['file'], args['temp_file'])
-	args['temp_file'], args['file'] = args['file'], args['temp_file']
-
-	del only_filename, original_extension, filename, main_extension, output_file
+	del path, main_extension, output_name
 
 	# Initialize the ReadWatchLog class with the arguments
 	rwl = ReadWatchLog(args=args)
 
-	# Runs the action
-	rwl.run()
+	# Runs the action; invalid input is only turned into an exit here, at the CLI boundary
+	try:
+		rwl.run()
+	except RwlInputError as e:
+		sys.exit(str(e))
 
 if __name__ == '__main__':
 
-	parser = argparse.ArgumentParser(description="Read-Watch-Log")
-
-	Define the arguments
-	parser.add_argument('--start', type=int, default=None, help='Start value')
-	parser.add_argument('--end', type=int, default=None, help='End value')
-	parser.add_argument('--output', action='store_true', help='Output flag. If true, output is created. Optional argument.')
-	parser.add_argument('--file', type=str, required=True, default="Vault.xlsx", help='File name to process (XSLX/ODS formats). Required argument.')
-	parser.add_argument('--custom_name', type=str, default=datetime.now().strftime("output_%d%m%Y%H%M%S%f"), help='Custom name of output file (without filetype)')
-	parser.add_argument('--chunk', type=int, default=0, help='Chunk size. Algorithm processes only given number of records. Used with argument `links`.')
-	parser.add_argument('--auto', action='store_true', help='Autosearch of a non-processed record. Used with argument `links`.')
-	parser.add_argument('--sheet', type=str, required=True, default="Vault", help='Sheetname of the given document. Required argument.')
-
-	Create a mutually exclusive group
-	group = parser.add_mutually_exclusive_group()
-
-	Add mutually exclusive arguments
-	group.add_argument('--links', action='store_true', help='Get links')
-	group.add_argument('--routines', action='store_true', help='Get routines')
-	group.add_argument('--tags', action='store_true', help='Order tags')
-	group.add_argument('--json', action='store_true', help='Convert to JSON')
-	group.add_argument('--duplicates', action='store_true', help='Detect duplicates')
-
-	main(args=parser.parse_args())
\ No newline at end of file
+	main(args=_build_parser().parse_args())
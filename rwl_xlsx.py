@@ -3,12 +3,13 @@
 from collections import defaultdict
 from contextlib import contextmanager
 from datetime import datetime
+from itertools import compress
 from openpyxl import load_workbook
 from openpyxl.workbook import Workbook
 from rwl_base import BaseProcessor
-from tqdm import tqdm
 from typing import Any, Dict, Generator, List, Optional
 from utilities import Utilities
+import shutil
 
 class XlsxProcessor(BaseProcessor):
 	"""
@@ -20,14 +21,22 @@ class XlsxProcessor(BaseProcessor):
 
 	Attributes:
 		__slots__ (tuple): A tuple of instance variable names to optimize memory usage.
+		_columns (dict): 1-based column numbers keyed by header name, read when the workbook is loaded.
+		_dirty (bool): Whether a cell value was changed since the workbook was loaded.
+		_header (tuple): The header row values, up to the first empty cell.
+		_valid_rows (list | None): `(row, link)` pairs of incomplete records, filled on first use.
+		_ws (Worksheet): The worksheet selected by `_workbook_manager`.
 
 	Methods:
 		_check_for_duplicates() -> dict
 			Checks for duplicate links in an XLSX file and returns their indices.
 
-		__check_record(row) -> bool
+		__check_record(values: tuple, cols: dict) -> bool
 			Checks if a worksheet row represents an incomplete or invalid record.
 
+		__collect_records(min_row: int, max_row: int | None) -> list
+			Collects the rows holding a YouTube link whose record is incomplete.
+
 		_convert_to_json() -> dict
 			Converts the active worksheet into a JSON-compatible dictionary.
 
@@ -37,6 +46,18 @@ class XlsxProcessor(BaseProcessor):
 		__get_col_number(col_name: str) -> int | None
 			Finds the column number for a given column name in the worksheet.
 
+		__get_header_width() -> int
+			Counts the header columns in the first row of the worksheet.
+
+		__get_record_columns() -> dict
+			Maps the columns checked by `__check_record` to their column numbers.
+
+		__get_valid_rows() -> list
+			Returns the incomplete records of the whole worksheet, scanning it once per load.
+
+		__read_rows(min_row: int, max_row: int | None) -> Generator
+			Reads worksheet rows as tuples of cell values.
+
 		_get_links() -> dict
 			Extracts YouTube links from an Excel worksheet and processes them to store video durations.
 
@@ -49,10 +70,10 @@ class XlsxProcessor(BaseProcessor):
 		_order_tags() -> None
 			Sorts tag values in worksheet rows in ascending order.
 
-		_process_yt_link(link: str, row: int) -> dict
+		_process_yt_link(link: str, row: int, videos: dict | None) -> dict
 			Processes a YouTube link to extract video details and duration.
 	"""
-	__slots__ = ("_ws")
+	__slots__ = ("_columns", "_dirty", "_header", "_valid_rows", "_ws")
 
 	def _check_for_duplicates(self) -> Dict[str, List[int]]:
 		"""
@@ -66,70 +87,60 @@ class XlsxProcessor(BaseProcessor):
 			dict: Mapping of duplicate links to their indices, e.g., 
 				{'link1': [0, 3], 'link2': [1, 5]}. Empty dict if no duplicates found.
 		"""
-		# Collect links with indices in one pass
-		column = 2
-		row = 2
-		link_indices = defaultdict(list)
+		first_seen: Dict[str, int] = {}  # Index of each link's first occurrence
+		duplicates: Dict[str, List[int]] = {}  # Only the links seen more than once get a list
 
-		while (value := self._ws.cell(row=row, column=column).value):
-			link_indices[value].append(row - 2)  # Zero-based index
-			row += 1
+		for index, (link,) in enumerate(self._ws.iter_rows(min_row=2, min_col=2, max_col=2, values_only=True)):
+			if not link:
+				break
 
-		# Filter to duplicates only
-		return {
-			link: indices
-			for link, indices in link_indices.items()
-			if len(indices) > 1
-		}
+			if (first_index := first_seen.setdefault(link, index)) != index:  # Zero-based index
+				if (indices := duplicates.get(link)) is None:
+					indices = duplicates[link] = [first_index]
+				indices.append(index)
+
+		# Order by first occurrence, as the links appear in the worksheet
+		return dict(sorted(duplicates.items(), key=lambda item: item[1][0]))
 
-	def __check_record(self, row) -> bool:
+	def __check_record(self, values: tuple, cols: Dict[str, int]) -> bool:
 		"""
 		Checks if a worksheet row represents an incomplete or invalid record.
 
-		Examines the specified row in the worksheet (`self._ws`), retrieving values from the 'Duration',
+		Examines the values of a worksheet row, as read by `__read_rows`, in the 'Duration',
 		'Published', 'Author', and 'Exist' columns. Returns True if any of 'Duration', 'Published', or
 		'Author' is a placeholder ('.') while 'Exist' is not a placeholder, indicating an incomplete record.
 
 		Args:
-			row (int): The row number in the worksheet to check.
+			values (tuple): The cell values of the row to check.
+			cols (dict): Column numbers of the checked fields, as returned by `__get_record_columns`.
 
 		Returns:
 			bool: True if the record is incomplete (has '.' in key fields but not in 'Exist'), False otherwise.
 
 		Raises:
-			AttributeError: If `self._ws` or `self.__get_col_number` is not initialized.
-			ValueError: If `row` is not a valid integer or out of the worksheet's bounds.
-			KeyError: If any required column ('Duration', 'Published', 'Author', 'Exist') is not found by
+			TypeError: If any required column ('Duration', 'Published', 'Author', 'Exist') was not found by
 					`self.__get_col_number`.
 
 		Notes:
-			- Relies on `self._ws` as the worksheet object and `self.__get_col_number` to map column names
-			to indices.
+			- Column numbers are 1-based, while `values` is indexed from 0.
 			- A '.' value indicates a placeholder or missing data in the respective field.
 		"""
-		# Cache column indices (assuming they don’t change per call)
-		cols = {
-			'Duration':	 self.__get_col_number('Duration'),
-			'Published': self.__get_col_number('Published'),
-			'Author':	 self.__get_col_number('Author'),
-			'Exist':	 self.__get_col_number('Exist')
-		}
-
 		# Early exit if 'Exist' is not a placeholder
-		if self._ws.cell(row=row, column=cols['Exist']).value != '.':
+		if values[cols['Exist'] - 1] != '.':
 			return False
 
-		# Check key fields for placeholders
-		return any(
-			self._ws.cell(row=row, column=cols[field]).value == '.'
-			for field in ('Duration', 'Published', 'Author')
+		# Check key fields for placeholders; spelled out, as a generator per row costs more than the checks
+		return (
+			values[cols['Duration'] - 1] == '.'
+			or values[cols['Published'] - 1] == '.'
+			or values[cols['Author'] - 1] == '.'
 		)
 
 	def __get_col_number(self, col_name: str) -> int | None:
 		"""
 		Finds the column number for a given column name in the worksheet.
 
-		Searches row 1 of the worksheet for a cell matching the provided column name,
+		Looks the name up in the header columns read by `_workbook_manager`,
 		returning its 1-based column number. Returns None if no match is found.
 
 		Args:
@@ -138,12 +149,88 @@ class XlsxProcessor(BaseProcessor):
 		Returns:
 			int: 1-based column number if the name is found, None otherwise.
 		"""
-		row = 1
-		column = 1
-		while (value := self._ws.cell(row=row, column=column).value):
+		return self._columns.get(col_name)
+
+	def __get_header_width(self) -> int:
+		"""
+		Counts the header columns in the first row of the worksheet.
+
+		Returns:
+			int: The number of consecutive non-empty cells in row 1, starting from column 1.
+		"""
+		return len(self._header)
+
+	def __get_record_columns(self) -> Dict[str, int]:
+		"""
+		Maps the columns checked by `__check_record` to their column numbers.
+
+		Returns:
+			dict: 1-based column numbers of 'Duration', 'Published', 'Author' and 'Exist'.
+		"""
+		return {
+			field: self.__get_col_number(col_name=field)
+			for field in ('Duration', 'Published', 'Author', 'Exist')
+		}
+
+	def __get_valid_rows(self) -> List[tuple[int, str]]:
+		"""
+		Returns the incomplete records of the whole worksheet, scanning it once per load.
+
+		Returns:
+			list: `(row, link)` pairs as returned by `__collect_records`, starting from row 2.
+		"""
+		if self._valid_rows is None:
+			self._valid_rows = self.__collect_records(min_row=2)
+		return self._valid_rows
+
+	def __collect_records(self, min_row: int, max_row: Optional[int] = None) -> List[tuple[int, str]]:
+		"""
+		Collects the rows holding a YouTube link whose record is incomplete.
+
+		Args:
+			min_row (int): The first row to scan.
+			max_row (int, optional): The last row to scan, inclusive (default: the last worksheet row).
+
+		Returns:
+			list: `(row, link)` pairs in row order, for rows that pass `__check_record`.
+		"""
+		link_index = 1  # Links are in column 2
+		cols = self.__get_record_columns()
+		records: List[tuple[int, str]] = []
+
+		# Bind the per-row lookups to locals once, outside the loop
+		yt_prefix = self._YT_PREFIX
+		check_record = self.__check_record
+		append = records.append
+
+		for row, values in enumerate(self.__read_rows(min_row=min_row, max_row=max_row), start=min_row):
+			link = values[link_index]
 			
-			if value == col_name: return column
-			column += 1
+			# Early continue for invalid links
+			if not (isinstance(link, str) and yt_prefix in link):
+				continue
+				
+			if check_record(values=values, cols=cols):
+				append((row, link))
+
+		return records
+
+	def __read_rows(self, min_row: int, max_row: Optional[int] = None) -> Generator[tuple, None, None]:
+		"""
+		Reads worksheet rows as tuples of cell values.
+
+		Streams the rows through `iter_rows(values_only=True)` instead of building a `Cell` object per
+		access, limited to the header columns and to rows that exist in the worksheet.
+
+		Args:
+			min_row (int): The first row to read.
+			max_row (int, optional): The last row to read, inclusive (default: the last worksheet row).
+
+		Yields:
+			tuple: The values of one row, where index 0 holds column 1.
+		"""
+		max_row = self._ws.max_row if max_row is None else min(max_row, self._ws.max_row)
+		yield from self._ws.iter_rows(min_row=min_row, max_row=max_row, max_col=self.__get_header_width(), values_only=True)
 
 	def __get_last_row_number(self) -> int:
 		"""
@@ -154,11 +241,17 @@ class XlsxProcessor(BaseProcessor):
 
 		Returns:
 			int: The row number of the last populated cell in the first column.
+
+		Notes:
+			- Reads column 1 through `iter_rows`, bounded by `max_row`, instead of one `cell` call per row;
+			a column filled up to `max_row` ends at `max_row + 1` without touching a cell past the data.
+			- The first empty cell ends the search, so a gap in column 1 is honoured as before
+			(a binary search over `max_row` could land past it).
 		"""
-		row = 1
-		while self._ws.cell(row=row, column=1).value:
-			row += 1
-		return row
+		for row, (value,) in enumerate(self._ws.iter_rows(min_row=1, max_col=1, values_only=True), start=1):
+			if not value:
+				return row
+		return self._ws.max_row + 1
 
 	def _convert_to_json(self) -> Dict[str, Dict[str, Any]]:
 		"""
@@ -174,32 +267,33 @@ class XlsxProcessor(BaseProcessor):
 		Notes:
 			- Assumes `_ws` is the worksheet object and the first row contains headers.
 			- Removes the second column’s value from nested dictionaries.
+			- Each row is paired with the headers through `zip` and `itertools.compress`, so no per-cell indexing is done.
 			- Requires `datetime` for date formatting if 'Date' column exists.
 		"""
-		columns = []
-		row, column = 1, 1
+		columns = self._header  # Column headers, read once by `_workbook_manager`
 
-		# Extract column headers
-		while (cell_value := self._ws.cell(row=row, column=column).value):
-			columns.append(cell_value)
-			column += 1
+		# The second column's value becomes the key, so its header is left out of the nested dictionaries
+		selectors = [col != columns[1] for col in columns]
+		names = list(compress(columns, selectors))
+		has_date = "Date" in names
+		date_strings: Dict[datetime, str] = {}  # Formatted dates, as many rows share a day
 
 		vault = {}
-		row = 2  # Start from the second row, assuming the first row is headers
 
-		while (key := self._ws.cell(row=row, column=2).value):  # Use column 2 as keys
-			row_data = {
-				col: self._ws.cell(row=row, column=columns.index(col) + 1).value
-				for col in columns
-			}
+		# Start from the second row, assuming the first row is headers
+		for values in self._ws.iter_rows(min_row=2, max_col=len(columns), values_only=True):
+			if not (key := values[1]):  # Use column 2 as keys
+				break
+
+			row_data = dict(zip(names, compress(values, selectors)))
 
 			# Convert Date field to string if it exists and is a datetime object
-			if "Date" in row_data and isinstance(row_data["Date"], datetime):
-				row_data["Date"] = row_data["Date"].strftime("%d/%m/%y")
+			if has_date and isinstance(date := row_data["Date"], datetime):
+				if (date_string := date_strings.get(date)) is None:
+					date_string = date_strings[date] = date.strftime("%d/%m/%y")
+				row_data["Date"] = date_string
 
 			vault[key] = row_data
-			vault[key].pop(columns[1], None)  # Remove the second column's value from the dictionary
-			row += 1
 
 		return vault
 
@@ -207,20 +301,14 @@ class XlsxProcessor(BaseProcessor):
 		"""
 		Finds the starting row containing a valid YouTube link.
 
-		Iterates through rows in a fixed column, searching for a cell containing 
-		a YouTube link (`self._YT_PREFIX`). It returns the row index of the first 
-		valid record that meets `self.__check_record(row)`.
+		Takes the first of the records found by `__get_valid_rows`, i.e. the first row
+		containing a YouTube link (`self._YT_PREFIX`) that meets `self.__check_record`.
 
 		Returns:
 			int: The row index of the first valid YouTube link.
 		"""
-		column = 2
-		row = 2
-
-		while link := self._ws.cell(row=row, column=column).value:
-			if isinstance(link, str) and self._YT_PREFIX in link and self.__check_record(row=row):
-				return row
-			row += 1
+		valid_rows = self.__get_valid_rows()
+		return valid_rows[0][0] if valid_rows else None
 
 	def _get_links(self) -> dict:
 		"""
@@ -239,11 +327,15 @@ class XlsxProcessor(BaseProcessor):
 		Notes:
 			- Uses `_START` and `_END` for row range, adjusted by `_CHUNK` or autosearch (`_AUTOSEARCH`).
 			- Assumes `_ws` is the worksheet object and `_YT_PREFIX` defines valid YouTube link prefixes.
-			- Caches column indices in `attr_columns` for efficiency.
-			- Requires `tqdm` for progress tracking and private methods (`__find_starting_row`, `__get_last_row_number`, etc.).
+			- Resolves the attribute columns once, through `__get_record_columns`, before the loop.
+			- Requires `tqdm` for progress tracking (imported here, as no other action uses it) and private methods (`__find_starting_row`, `__get_last_row_number`, etc.).
+			- Video details are fetched in batches via `_prefetch_yt_videos` before the rows are updated,
+			and handed to `_process_yt_link` so the cache is not reopened per row.
+			- Sets `self._dirty` when a placeholder cell is filled in.
 		"""
+		from tqdm import tqdm
+
 		links: Dict[str, Dict[str, Any]] = {}
-		LINK_COLUMN: int = 2  # Constant for link column index
 		
 		if self._AUTOSEARCH:
 			self._START = self.__find_starting_row()
@@ -256,33 +348,33 @@ class XlsxProcessor(BaseProcessor):
 				raise ValueError("Value not found: --start is not defined")
 			self._END = self._START + self._CHUNK
 
-		# Pre-calculate column numbers to avoid repeated calls
-		attr_columns: Dict[str, int] = {}
+		# Pre-calculate column numbers of the written attributes (the same fields `__check_record` reads)
+		attr_columns: Dict[str, int] = self.__get_record_columns()
+
+		# Collect the records to process before any API request is made
+		if self._AUTOSEARCH:
+			# The starting row came from the same scan, so reuse it instead of reading the rows again
+			records = [record for record in self.__get_valid_rows() if record[0] < self._END]
+		else:
+			records = self.__collect_records(min_row=self._START, max_row=self._END - 1)
+
+		# Fetch video details for all records in batched API requests
+		videos = self._prefetch_yt_videos(links=[link for _, link in records])
 		
 		# Process rows with progress tracking
-		for row in tqdm(range(self._START, self._END), desc="Processing YouTube links"):
-			link = self._ws.cell(row=row, column=LINK_COLUMN).value
-			
-			# Early continue for invalid links
-			if not (isinstance(link, str) and self._YT_PREFIX in link):
-				continue
-				
-			if not self.__check_record(row=row):
-				continue
-				
+		for row, link in tqdm(records, desc="Processing YouTube links"):
 			# Process link and update worksheet
-			link_info = self._process_yt_link(link=link, row=row)
+			link_info = self._process_yt_link(link=link, row=row, videos=videos)
 			if not link_info or link not in link_info:
 				continue
 				
-			# Cache column numbers and update cells efficiently
+			# Update cells efficiently
 			for attribute, value in link_info[link].items():
 				if value:
-					if attribute not in attr_columns:
-						attr_columns[attribute] = self.__get_col_number(col_name=attribute)
 					col = attr_columns[attribute]
-					if self._ws.cell(row=row, column=col).value == '.':
-						self._ws.cell(row=row, column=col).value = value
+					if (cell := self._ws.cell(row=row, column=col)).value == '.':
+						cell.value = value
+						self._dirty = True
 			
 			links.update(link_info)
 		return links
@@ -306,21 +398,37 @@ class XlsxProcessor(BaseProcessor):
 					...
 				}
 				Dates are strings in "dd-mm-yyyy" format; colors and values vary by row data.
+
+		Raises:
+			ValueError: If the header read by `_workbook_manager` lacks a 'Date' or 'Duration' column.
 		"""
 		date_column = self.__get_col_number(col_name='Date')
 		duration_column = self.__get_col_number(col_name='Duration')
+		if date_column is None or duration_column is None:
+			raise ValueError("Columns 'Date' and 'Duration' are required in the header")
+		date_index, duration_index = date_column - 1, duration_column - 1
 
-		routines: Dict[str, Dict[str, float]] = defaultdict(lambda: defaultdict(float))  # Default to 0.0 for colors
-		row = self._START
+		# Only read the span between the two columns, re-basing the indexes onto it
+		first_index = min(date_index, duration_index)
+		date_index, duration_index = date_index - first_index, duration_index - first_index
 
-		while (date := self._ws.cell(row=row, column=date_column).value):
+		routines: Dict[str, Dict[str, float]] = defaultdict(lambda: defaultdict(float))  # Default to 0.0 for colors
+		date_keys: Dict[datetime, str] = {}  # Formatted dates, as a day usually spans several rows
+
+		for cells in self._ws.iter_rows(
+			min_row=self._START,
+			min_col=first_index + 1,
+			max_col=first_index + max(date_index, duration_index) + 1
+		):
+			if not (date := cells[date_index].value):
+				break
 			
-			if (duration_cell := self._ws.cell(row=row, column=duration_column)).value != '.':
+			if (duration_cell := cells[duration_index]).value != '.':
 				value = float(duration_cell.value)
 				color = self._COLORS[duration_cell.fill.start_color.index]
-				routines[date.strftime("%d-%m-%Y")][color] += value  # Accumulate directly
-
-			row += 1
+				if (date_key := date_keys.get(date)) is None:
+					date_key = date_keys[date] = f"{date.day:02d}-{date.month:02d}-{date.year:04d}"  # Same key as strftime("%d-%m-%Y")
+				routines[date_key][color] += value  # Accumulate directly
 
 		# Convert to regular dict with rounded values
 		return {
@@ -332,16 +440,16 @@ class XlsxProcessor(BaseProcessor):
 		"""
 		Extracts column numbers of cells containing 'Tag' in the first row.
 
-		Scans row 1 of the worksheet, collecting 1-based column indices where the cell value
-		contains the substring 'Tag'. Stops at the first empty cell.
+		Scans the header read by `_workbook_manager` (row 1, up to the first empty cell), collecting
+		1-based column indices where the value contains the substring 'Tag'. The worksheet is not read again.
 
 		Returns:
 			list[int]: List of 1-based column numbers where 'Tag' appears in the value.
 		"""
 		return [
 			column
-			for column, cell in enumerate(self._ws[1], start=1)
-			if cell.value and 'Tag' in str(cell.value)
+			for column, value in enumerate(self._header, start=1)
+			if 'Tag' in str(value)
 		]
 
 	def _order_tags(self) -> None:
@@ -363,27 +471,30 @@ class XlsxProcessor(BaseProcessor):
 			- Relies on `self._ws` as the worksheet object and `self._START` as the starting row index.
 			- Uses `self._get_tags()` to retrieve the list of column indices for tag values.
 			- Placeholder values ('.') are ignored during sorting and not rewritten.
+			- Rows are fetched once through `iter_rows`, and values are written through the same `Cell` objects.
+			- Sets `self._dirty` only if a value actually moved.
 		"""
 		tags: List[int] = self._get_tags()
-		row = 2
 
-		while self._ws.cell(row=row, column=tags[0]).value:
+		# Positions of the tag columns within the span read by `iter_rows`
+		offsets: List[int] = [tag - tags[0] for tag in tags]
 
-			# Collect and sort non-placeholder tag values
-			tag_values = [
-				cell.value for tag in tags
-				if (cell := self._ws.cell(row=row, column=tag)).value != '.'
-			]
-			tag_values.sort()
+		for cells in self._ws.iter_rows(min_row=2, min_col=tags[0], max_col=tags[-1]):
+			tag_cells = [cells[offset] for offset in offsets]
+			if not tag_cells[0].value:
+				break
 
-			# Write sorted values back to tag columns
-			for tag_col, value in zip(tags, tag_values):
-				self._ws.cell(row=row, column=tag_col).value = value
+			# Collect and sort non-placeholder tag values
+			tag_values = sorted(cell.value for cell in tag_cells if cell.value != '.')
 
-			row += 1
+			# Write sorted values back to tag columns, skipping the ones already in place
+			for cell, value in zip(tag_cells, tag_values):
+				if cell.value != value:
+					cell.value = value
+					self._dirty = True
 
 	@contextmanager
-	def _workbook_manager(self) -> Generator[Workbook, None, None]:
+	def _workbook_manager(self, read_only: bool = False) -> Generator[Workbook, None, None]:
 		"""
 		A context manager that handles loading and saving an Excel workbook.
 
@@ -392,6 +503,10 @@ class XlsxProcessor(BaseProcessor):
 		Ensures the workbook is saved after execution, even if an error occurs, either to
 		`self._FILE` or to a generated output file if `self._OUTPUT` is True.
 
+		Args:
+			read_only (bool, optional): Loads the workbook in openpyxl's read-only mode, which
+				streams rows instead of building every cell in memory (default: False).
+
 		Yields:
 			openpyxl.workbook.Workbook: The loaded Excel workbook object.
 
@@ -407,17 +522,44 @@ class XlsxProcessor(BaseProcessor):
 			- Uses `self._utilities.generate_output_name` to create the output filename if
 			`self._OUTPUT` is True.
 			- The workbook is only saved if it was successfully loaded.
+			- A read-only workbook cannot be saved, so its source file is copied to the output instead;
+			the wrapped function must access rows through `iter_rows` rather than `cell`.
+			- The same copy is made when no cell was changed (`self._dirty` is False), which skips
+			serializing the whole workbook again.
+			- `self._columns`, `self._dirty`, `self._header` and `self._valid_rows` are only valid inside the block;
+			they are reset on exit.
 		"""
 		wb: Optional[Workbook] = None
+		self._dirty = False  # Set before loading, so `finally` can rely on it whatever fails
 		try:
-			wb = load_workbook(filename=self._FILE)
+			wb = load_workbook(filename=self._FILE, read_only=read_only)
 			self._ws = wb[self._SHEETNAME]
+
+			# Read the header once, so column lookups no longer touch the worksheet
+			header = []
+			for value in next(self._ws.iter_rows(max_row=1, values_only=True), ()):
+				if not value:
+					break
+				header.append(value)
+			self._header = tuple(header)
+			self._columns = {}
+			for column, name in enumerate(self._header, start=1):
+				self._columns.setdefault(name, column)  # Keep the first match, as a left-to-right search would
+			self._valid_rows = None
+
 			yield wb  # Yield control to the wrapped function
 		finally:
 			if wb is not None:  # Ensure wb exists before trying to save
 				if self._OUTPUT:
 					filename = f"{self._utilities.generate_output_name(custom_name=self._CUSTOM_NAME)}.xlsx"
-					wb.save(filename)
 				else:
 					filename = f"{self._utilities.generate_output_name(custom_name=self._ONLY_FILENAME)}.xlsx"
-					wb.save(filename)
\ No newline at end of file
+
+				if read_only or not self._dirty:
+					wb.close()  # Release the file handle kept open by read-only mode
+					shutil.copyfile(self._FILE, filename)
+				else:
+					wb.save(filename)
+
+			# Drop the per-load caches, so a later load never sees the previous workbook's columns or rows
+			self._columns, self._dirty, self._header, self._valid_rows = {}, False, (), None
\ No newline at end of file
@@ -9,8 +9,32 @@ import colorlog
 import json
 import logging
 import os
+import sys
 import uuid
 
+# Separator framing each record in the log files
+_SEP = '-' * 50
+
+# Formatters are stateless, so they are built once and shared by every `Utilities` instance
+## File format
+_FILE_FORMATTER = logging.Formatter(
+	f'\n{_SEP}\n%(asctime)s | %(levelname)-8s | %(threadName)s | %(name)s | %(message)s\n{_SEP}'
+)
+
+## Console formats: colored on a terminal, plain when the output is redirected
+_CONSOLE_FORMAT = '%(asctime)s | %(levelname)-8s | %(name)s | %(message)s'
+_CONSOLE_FORMATTER = logging.Formatter(_CONSOLE_FORMAT)
+_COLOR_CONSOLE_FORMATTER = colorlog.ColoredFormatter(
+	f'%(log_color)s{_CONSOLE_FORMAT}',
+	log_colors={
+		'DEBUG':	'cyan',
+		'INFO':		'green',
+		'WARNING':	'yellow',
+		'ERROR':	'red',
+		'CRITICAL':	'bold_red',
+	}
+)
+
 class Utilities:
 	"""
 	A class to represent extra functions,
@@ -20,7 +44,8 @@ class Utilities:
 
 	Attributes
 	----------
-	None
+	logger : logging.Logger
+		Module logger with console and rotating file handlers
 
 	Methods
 	-------
@@ -32,6 +57,8 @@ class Utilities:
 	def create_output(file)
 		Create output file
 	"""
+	__slots__ = ("logger", "__TIMESTAMP_FORMAT", "__directories")
+
 	def __init__(self):
 
 		self.__TIMESTAMP_FORMAT = '%m%d%Y_%H%M%S_%f'  # Class-level constant
@@ -39,7 +66,8 @@ class Utilities:
 								'outputs':	'outputs',
 								'logs':		'logs'
 							}
-		(os.makedirs(d, exist_ok=True) for d in self.__directories.values())
+		for d in self.__directories.values():
+			os.makedirs(d, exist_ok=True)
 
 		# Method for logger-setup
 		self.__setup_logger()
@@ -51,25 +79,12 @@ class Utilities:
 		self.logger.setLevel(logging.DEBUG)			# Set to DEBUG to allow all levels
 		self.logger.handlers.clear()				# Remove existing handlers (useful when running multiple instances)
 
-		## Defining console format
-		formatter = logging.Formatter(
-			f'\n{'-' * 50}\n%(asctime)s | %(levelname)-8s | %(threadName)s | %(name)s | %(message)s\n{'-' * 50}'
-		)
-
 		# Console Stream Handler
-		# Defining console format
-		console_formatter = colorlog.ColoredFormatter(
-			'%(log_color)s%(asctime)s | %(levelname)-8s | %(name)s | %(message)s',
-			log_colors={
-				'DEBUG':	'cyan',
-				'INFO':		'green',
-				'WARNING':	'yellow',
-				'ERROR':	'red',
-				'CRITICAL':	'bold_red',
-			}
-		)
+		console_handler = logging.StreamHandler()		# Handles all log types (writes to sys.stderr)
+
+		# Colors are only useful on a terminal; redirected output gets the same format without ANSI codes
+		console_formatter = _COLOR_CONSOLE_FORMATTER if sys.stderr.isatty() else _CONSOLE_FORMATTER
 
-		console_handler = logging.StreamHandler()		# Handles all log types
 		console_handler.setFormatter(console_formatter)	# Setting formatter
 		self.logger.addHandler(console_handler)			# Adding handler
 
@@ -78,11 +93,12 @@ class Utilities:
 			os.path.join(self.__directories['logs'], "info.log"),
 			maxBytes=1024 * 1024,  # 1 MB per file
 			backupCount=5,
-			encoding='utf-8'
+			encoding='utf-8',
+			delay=True  # Open the file on the first record, so unused logs are never created
 		)
 		info_handler.addFilter(lambda record: record.levelno < logging.ERROR)	# Filters out ERROR and CRITICAL
 		info_handler.setLevel(logging.INFO)		# Handles INFO and WARNING
-		info_handler.setFormatter(formatter)	# Setting formatter
+		info_handler.setFormatter(_FILE_FORMATTER)	# Setting formatter
 		self.logger.addHandler(info_handler)	# Adding handler
 
 		# RotatingFileHandler for ERROR logs (error.log)
@@ -90,10 +106,11 @@ class Utilities:
 			os.path.join(self.__directories['logs'], "error.log"),
 			maxBytes=1024 * 1024,  # 1 MB per file
 			backupCount=5,
-			encoding='utf-8'
+			encoding='utf-8',
+			delay=True  # Open the file on the first record, so unused logs are never created
 		)
 		error_handler.setLevel(logging.ERROR)	# Handles only ERROR and CRITICAL
-		error_handler.setFormatter(formatter)	# Setting formatter
+		error_handler.setFormatter(_FILE_FORMATTER)	# Setting formatter
 		self.logger.addHandler(error_handler)	# Adding handler
 
 		# Ensure logs are not duplicated
@@ -114,16 +131,19 @@ class Utilities:
 		-------
 		None
 		"""
-		output_files = os.listdir(self.__directories['outputs'])
-
-		json_files = filter(lambda json_file: True if '.json' in json_file else False, output_files)
+		# One directory scan; earlier merges are skipped so their entries are not merged twice
+		with os.scandir(self.__directories['outputs']) as entries:
+			json_files = [
+				entry for entry in entries
+				if entry.name.endswith('.json') and not entry.name.startswith('merged_outputs_') and entry.is_file()
+			]
 
 		merged_outputs = {}
 
 		for sf in json_files:
 
-			self.logger.info(f"Adding the output-file '{sf}'")
-			with open(os.path.join(self.__directories['outputs'], sf), 'r') as json_file:
+			self.logger.info(f"Adding the output-file '{sf.name}'")
+			with open(sf.path, 'r', encoding='utf-8') as json_file:
 				json_output_data = json.load(json_file)
 
 			merged_outputs.update(json_output_data)
@@ -136,7 +156,7 @@ class Utilities:
 		self.logger.info(f"Saving the outputs into '{merged_file}'")
 
 		# Save all files into output-file
-		with open(os.path.join(self.__directories['results'], merged_file), 'w', encoding='utf-8') as merged:
+		with open(os.path.join(self.__directories['outputs'], merged_file), 'w', encoding='utf-8') as merged:
 			json.dump(merged_outputs, merged, ensure_ascii=False, indent=4)
 
 	def generate_output_name(self, custom_name=None, unique_id=None):
@@ -202,13 +222,12 @@ class Utilities:
 				filename = Path(f"{self.generate_output_name(custom_name)}.json")
 				self.logger.info(f"Saving output file: {filename}")
 				
-				# Write JSON with error handling
+				# Stream JSON into the file instead of building the whole string first
 				try:
-					filename.write_text(
-						json.dumps(result, ensure_ascii=False, indent=4),
-						encoding="utf-8"
-					)
+					with filename.open('w', encoding='utf-8') as output_file:
+						json.dump(result, output_file, ensure_ascii=False, indent=4)
 				except (IOError, TypeError) as e:
+					filename.unlink(missing_ok=True)  # Don't leave a partially written file behind
 					self.logger.error(f"Failed to save output file {filename}: {e}")
 
 			return result